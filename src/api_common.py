@@ -0,0 +1,97 @@
+"""
+Shared helpers for the SSG-WSG API scripts
+
+Certificate, connection and logging setup used by more than one script. Importing this
+module has no side effects beyond defining these helpers.
+
+Author: Generated for NTU Data Science & AI Capstone Project
+Date: October 2025
+"""
+
+import certifi
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+import functools
+import logging
+import logging.handlers
+import os
+import socket
+import ssl
+from typing import Optional, Tuple
+
+
+@functools.lru_cache(maxsize=8)
+def cert_tuple(cert_path: str, key_path: str) -> Tuple[str, str]:
+    """
+    Check that the certificate and key files exist, once per path pair.
+    
+    Returns:
+    Tuple[str, str]: (cert_path, key_path), ready to pass as a requests cert
+    
+    Raises:
+    FileNotFoundError: If either file is missing (failures are not cached)
+    """
+    if not os.path.exists(cert_path):
+        raise FileNotFoundError(f"Certificate file not found: {cert_path}")
+    if not os.path.exists(key_path):
+        raise FileNotFoundError(f"Key file not found: {key_path}")
+    return (cert_path, key_path)
+
+
+def buffered_logger(name: str) -> logging.Logger:
+    """
+    Return the named logger with a memory-buffered stderr handler attached.
+    
+    Request diagnostics are logged at DEBUG and buffered in memory; they stay
+    silent unless the logger's level is lowered (root defaults to WARNING).
+    Errors flush the buffer immediately.
+    """
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, logging.handlers.MemoryHandler) for h in logger.handlers):
+        logger.addHandler(logging.handlers.MemoryHandler(capacity=1024, target=logging.StreamHandler()))
+    return logger
+
+
+# TCP keep-alive probes keep idle mTLS connections from being silently
+# dropped by NATs/firewalls between examples (forcing a new handshake).
+# Idle/interval/count tuning is only available on some platforms (e.g. Linux).
+_KEEPALIVE_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _name, _value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+    if hasattr(socket, _name):
+        _KEEPALIVE_SOCKET_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _name), _value))
+
+
+@functools.lru_cache(maxsize=8)
+def client_ssl_context(cert_path: str, key_path: str) -> ssl.SSLContext:
+    """
+    Build (once per cert/key pair) an SSLContext holding the client certificate.
+    
+    Sharing one context across sessions and connection pools avoids parsing
+    the PEM files and loading the private key again for every new client.
+    """
+    context = ssl.create_default_context(cafile=certifi.where())
+    context.load_cert_chain(cert_path, key_path)
+    return context
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets have TCP keep-alive enabled.
+    
+    An optional ssl_context (e.g. from client_ssl_context) is handed to every
+    connection pool, so HTTPS connections reuse it instead of building their own.
+    """
+    
+    def __init__(self, *args, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        # Set before super().__init__(), which calls init_poolmanager()
+        self.ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault(
+            "socket_options",
+            HTTPConnection.default_socket_options + _KEEPALIVE_SOCKET_OPTIONS
+        )
+        if self.ssl_context is not None:
+            kwargs.setdefault("ssl_context", self.ssl_context)
+        super().init_poolmanager(*args, **kwargs)
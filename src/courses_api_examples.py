@@ -12,14 +12,106 @@ Date: October 2025
 """
 
 import requests
+from urllib3.util.retry import Retry
+import asyncio
+import atexit
+import contextlib
+import functools
+import importlib.util
 import json
 import os
+import re
+import ssl
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Hashable, AsyncIterator, Awaitable, Callable, Iterator
+from cachetools import TTLCache
+from cachetools.keys import hashkey
 
-class CoursesAPI:
+from api_common import KeepAliveHTTPAdapter, client_ssl_context
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: only needed for CoursesAPI.stream_titles
+    ijson = None
+
+try:
+    import httpx
+except ImportError:  # Optional: only needed for AsyncCoursesAPI
+    httpx = None
+
+# httpx only speaks HTTP/2 when the h2 package is present (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import requests_cache
+except ImportError:  # Optional: responses are then only cached in-process
+    requests_cache = None
+
+# Client certificate used by the examples
+_CERT_DIR = os.path.join(os.path.dirname(__file__), "..", "certificates")
+CERT_PATH = os.path.join(_CERT_DIR, "cert.pem")
+KEY_PATH = os.path.join(_CERT_DIR, "key.pem")
+
+# On-disk response cache shared across runs (used when requests-cache is installed)
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "courses_api_cache")
+
+# Per-endpoint lifetimes (seconds); anything else uses the 10 minute default.
+# Patterns are prefix globs, so /courses/categories also covers subCategories.
+HTTP_CACHE_EXPIRY = {
+    "api.ssg-wsg.sg/courses/categories": 3600,
+    "api.ssg-wsg.sg/courses/tags": 3600,
+    "api.ssg-wsg.sg/courses/directory/popular": 300,
+    "api.ssg-wsg.sg/courses/directory/featured": 300,
+}
+
+def _loads(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _course_tagging_codes(course: Dict[str, Any]) -> List[str]:
+    """Return the tagging codes on a course, whether listed as strings or objects."""
+    codes = []
+    for tag in course.get('taggingCodes') or []:
+        if isinstance(tag, dict):
+            tag = tag.get('code')
+        if tag is not None:
+            codes.append(str(tag))
+    return codes
+
+def group_courses_by_tagging(result: Dict[str, Any],
+                             tagging_codes: List[str]) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Client for SSG-WSG Courses API with certificate authentication.
+    Split a multi-code tagging search result into courses per tagging code.
+    
+    Args:
+        result: Response from search_courses_by_tagging
+        tagging_codes: The codes that were searched for
+        
+    Returns:
+        Dictionary mapping each tagging code to the courses carrying it
+        (a course with several of the codes appears under each of them)
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {code: [] for code in tagging_codes}
+    for course in result.get('data', {}).get('courses', []):
+        for code in _course_tagging_codes(course):
+            if code in grouped:
+                grouped[code].append(course)
+    return grouped
+
+class _CoursesAPIBase:
+    """
+    Endpoint methods and request handling shared by CoursesAPI and
+    AsyncCoursesAPI. Use one of those; helpers that only work over a blocking
+    session (e.g. title streaming) live on CoursesAPI itself.
     
     Base URL: https://api.ssg-wsg.sg
     Authentication: Certificate-based (mTLS)
@@ -36,13 +128,63 @@ class CoursesAPI:
         self.base_url = "https://api.ssg-wsg.sg"
         self.cert_path = cert_path
         self.key_path = key_path
-        self.session = requests.Session()
-        self.session.cert = (cert_path, key_path)
+        if requests_cache is not None:
+            # SQLite-backed HTTP cache, so re-running the examples can skip
+            # the network entirely; CachedSession is a requests.Session.
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=600,
+                urls_expire_after=HTTP_CACHE_EXPIRY,
+                allowable_methods=('GET',),
+                match_headers=['x-api-version'],
+                cache_control=True
+            )
+        else:
+            self.session = requests.Session()
+        
+        # Larger keep-alive connection pool plus retry with backoff on transient
+        # errors; the client certificate comes from the shared SSL context.
+        adapter = KeepAliveHTTPAdapter(
+            ssl_context=client_ssl_context(cert_path, key_path),
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET"]),
+                # Hand the last response back so raise_for_status() can log it
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        
+        # Memoize GET responses in-process for 5 minutes
+        self._cache = TTLCache(maxsize=512, ttl=300)
     
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
-                     headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    @staticmethod
+    def _cache_key(endpoint: str, params: Optional[Dict[str, Any]],
+                   headers: Dict[str, str]) -> Optional[Hashable]:
         """
-        Make an authenticated API request.
+        Build the response-cache key for a request.
+        
+        Returns None for requests that must always hit the API, such as
+        DELTA retrievals which ask for changes since a given date.
+        """
+        params = params or {}
+        if params.get('retrieveType') == 'DELTA':
+            return None
+        return hashkey(endpoint, tuple(sorted(params.items())), headers.get('x-api-version'))
+    
+    def _make_request_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                          headers: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        Make an authenticated API request and return the undecoded body.
+        
+        Use this when the response is only written out unchanged (see
+        save_response_raw), to skip decoding and re-encoding the JSON.
+        Not memoized in-process; the on-disk HTTP cache still applies.
         
         Args:
             endpoint: API endpoint path
@@ -50,7 +192,7 @@ class CoursesAPI:
             headers: Request headers
             
         Returns:
-            JSON response as dictionary
+            Raw JSON response body
         """
         url = f"{self.base_url}{endpoint}"
         
@@ -61,15 +203,20 @@ class CoursesAPI:
         if 'x-api-version' not in headers:
             headers['x-api-version'] = 'v1'
         
+        # Requests we don't memoize must not be served from disk either
+        bypass_disk_cache = (requests_cache is not None
+                             and self._cache_key(endpoint, params, headers) is None)
+        
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=30
-            )
+            with self.session.cache_disabled() if bypass_disk_cache else contextlib.nullcontext():
+                response = self.session.get(
+                    url,
+                    params=params,
+                    headers=headers,
+                    timeout=30
+                )
             response.raise_for_status()
-            return response.json()
+            return response.content
             
         except requests.exceptions.RequestException as e:
             print(f"Error making request to {endpoint}: {str(e)}")
@@ -88,6 +235,36 @@ class CoursesAPI:
                         pass
             raise
     
+    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make an authenticated API request.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Request headers
+            
+        Returns:
+            JSON response as dictionary. Responses are cached for a few
+            minutes, so repeat calls return the same (shared) dictionary.
+        """
+        if headers is None:
+            headers = {}
+        
+        # Add default API version if not specified
+        if 'x-api-version' not in headers:
+            headers['x-api-version'] = 'v1'
+        
+        key = self._cache_key(endpoint, params, headers)
+        if key is not None and key in self._cache:
+            return self._cache[key]
+        
+        result = _loads(self._make_request_raw(endpoint, params, headers))
+        if key is not None:
+            self._cache[key] = result
+        return result
+    
     def get_course_categories(self, keyword: str) -> Dict[str, Any]:
         """
         Example 1: Get Course Categories by Keyword
@@ -216,6 +393,35 @@ class CoursesAPI:
             headers={'x-api-version': 'v2.1'}
         )
     
+    def search_multiple_taggings(self, tagging_codes: List[str],
+                                 support_end_date: str,
+                                 page_size: int = 10,
+                                 page: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Search several tagging codes in one round trip and group the results.
+        
+        Sends a single /courses/directory request with all codes joined, rather
+        than one request per code, then splits the returned courses by each
+        course's taggingCodes. As with search_courses_by_tagging, this cannot
+        be combined with a keyword search.
+        
+        Args:
+            tagging_codes: List of tagging codes (e.g., ['1', '2', '40'])
+            support_end_date: Format YYYYMMDD (e.g., '20250101')
+            page_size: Number of items per page (default: 10)
+            page: Page number, starting from 0 (default: 0)
+            
+        Returns:
+            Dictionary mapping each tagging code to its courses
+        """
+        result = self.search_courses_by_tagging(
+            tagging_codes=tagging_codes,
+            support_end_date=support_end_date,
+            page_size=page_size,
+            page=page
+        )
+        return group_courses_by_tagging(result, tagging_codes)
+    
     def get_course_autocomplete(self, keyword: str) -> Dict[str, Any]:
         """
         Example 5: Get Course Autocomplete Suggestions
@@ -371,143 +577,416 @@ class CoursesAPI:
             headers={'x-api-version': 'v1.2'}
         )
 
+class CoursesAPI(_CoursesAPIBase):
+    """
+    Client for SSG-WSG Courses API with certificate authentication.
+    
+    Base URL: https://api.ssg-wsg.sg
+    Authentication: Certificate-based (mTLS)
+    """
+    
+    def stream_titles(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None,
+                      prefix: str = 'data.courses.item.title') -> Iterator[str]:
+        """
+        Stream selected values out of a response without building the whole dict.
+        
+        The body is parsed incrementally with ijson as it arrives, so callers
+        that only need one field (e.g. course titles) never hold the full
+        response in memory. Use _make_request when the full response is needed.
+        Requires: pip install ijson
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Request headers
+            prefix: ijson path of the values to yield (default: course titles)
+            
+        Returns:
+            Iterator over the matching values
+        """
+        if ijson is None:
+            raise ImportError("stream_titles requires ijson: pip install ijson")
+        
+        url = f"{self.base_url}{endpoint}"
+        
+        if headers is None:
+            headers = {}
+        
+        # Add default API version if not specified
+        if 'x-api-version' not in headers:
+            headers['x-api-version'] = 'v1'
+        
+        # requests-cache reads the whole body before returning and hands back
+        # an already-consumed raw stream on hits, so stream around the cache
+        with self.session.cache_disabled() if requests_cache is not None else contextlib.nullcontext():
+            response = self.session.get(url, params=params, headers=headers,
+                                        timeout=30, stream=True)
+        with response:
+            response.raise_for_status()
+            # Let urllib3 undo gzip/br so ijson sees plain JSON
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix)
+    
+    def get_course_autocomplete_titles(self, keyword: str) -> Iterator[str]:
+        """
+        Stream just the course titles of get_course_autocomplete.
+        
+        Args:
+            keyword: Search keyword (minimum 3 characters)
+            
+        Returns:
+            Iterator over suggested course titles (may contain <b> highlight tags)
+        """
+        return self.stream_titles(
+            endpoint="/courses/directory/autocomplete",
+            params={'keyword': keyword},
+            headers={'x-api-version': 'v1.2'}
+        )
+
+class AsyncCoursesAPI(_CoursesAPIBase):
+    """
+    Asynchronous client for SSG-WSG Courses API, built on httpx.AsyncClient.
+    
+    Exposes the same endpoint methods as CoursesAPI (but not its streaming
+    helpers such as stream_titles); because they all return
+    self._make_request(...), here they return coroutines that must be awaited.
+    Independent calls can then be issued together with asyncio.gather(), and
+    are multiplexed over a single HTTP/2 connection when h2 is installed.
+    Responses are compressed with gzip, or brotli if the brotli package is
+    installed.
+    
+    Requires: pip install "httpx[http2]" (optionally: brotli)
+    """
+    
+    def __init__(self, cert_path: str, key_path: str, cache: Optional[TTLCache] = None):
+        """
+        Initialize the async Courses API client.
+        
+        Args:
+            cert_path: Path to the certificate file (.pem)
+            key_path: Path to the private key file (.pem)
+            cache: Response cache to share with another client; a new one is
+                created when omitted
+        """
+        if httpx is None:
+            raise ImportError("AsyncCoursesAPI requires httpx: pip install \"httpx[http2]\"")
+        
+        self.base_url = "https://api.ssg-wsg.sg"
+        self.cert_path = cert_path
+        self.key_path = key_path
+        self.client = httpx.AsyncClient(
+            verify=client_ssl_context(cert_path, key_path),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=30
+        )
+        self._cache = cache if cache is not None else TTLCache(maxsize=512, ttl=300)
+    
+    async def __aenter__(self) -> "AsyncCoursesAPI":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+    
+    async def search_multiple_taggings(self, tagging_codes: List[str],
+                                       support_end_date: str,
+                                       page_size: int = 10,
+                                       page: int = 0) -> Dict[str, List[Dict[str, Any]]]:
+        """Async version of CoursesAPI.search_multiple_taggings."""
+        result = await self.search_courses_by_tagging(
+            tagging_codes=tagging_codes,
+            support_end_date=support_end_date,
+            page_size=page_size,
+            page=page
+        )
+        return group_courses_by_tagging(result, tagging_codes)
+    
+    async def iter_pages(self, method: Callable[..., Awaitable[Dict[str, Any]]], /, *,
+                         page_size: int = 50, **kwargs) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over all pages of a paged search, one list of courses per page.
+        
+        The request for page N+1 is started before page N is handed to the
+        caller, so fetching overlaps with the caller's processing and only the
+        first page's round trip is waited on in full.
+        
+        Args:
+            method: A paged endpoint method of this client, e.g.
+                    api.search_courses_by_keyword or api.get_popular_courses
+            page_size: Number of items per page (default: 50)
+            **kwargs: Other arguments for method (e.g., keyword='python')
+            
+        Example:
+            async for courses in api.iter_pages(api.search_courses_by_keyword,
+                                                keyword='python'):
+                ...
+        
+        To stop early, wrap the iterator in contextlib.aclosing() so the
+        prefetched request is cancelled before the client is closed.
+        """
+        page = 0
+        next_page = asyncio.create_task(method(page_size=page_size, page=page, **kwargs))
+        try:
+            while next_page is not None:
+                result = await next_page
+                data = result.get('data', {})
+                courses = data.get('courses', [])
+                total = data.get('meta', {}).get('total')
+                
+                page += 1
+                has_more = len(courses) == page_size and (total is None or page * page_size < total)
+                next_page = (
+                    asyncio.create_task(method(page_size=page_size, page=page, **kwargs))
+                    if has_more else None
+                )
+                yield courses
+        finally:
+            # Consumer stopped early: don't leave the prefetch running
+            if next_page is not None and not next_page.done():
+                next_page.cancel()
+    
+    async def _make_request_raw(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                                headers: Optional[Dict[str, str]] = None) -> bytes:
+        """
+        Make an authenticated API request and return the undecoded body.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Request headers
+            
+        Returns:
+            Raw JSON response body
+        """
+        url = f"{self.base_url}{endpoint}"
+        
+        if headers is None:
+            headers = {}
+        
+        # Add default API version if not specified
+        if 'x-api-version' not in headers:
+            headers['x-api-version'] = 'v1'
+        
+        try:
+            response = await self.client.get(url, params=params, headers=headers)
+            response.raise_for_status()
+            return response.content
+            
+        except httpx.HTTPError as e:
+            print(f"Error making request to {endpoint}: {str(e)}")
+            resp = getattr(e, 'response', None)
+            if resp is not None:
+                print(f"Response: {resp.text}")
+            raise
+    
+    async def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Make an authenticated API request.
+        
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Request headers
+            
+        Returns:
+            JSON response as dictionary
+        """
+        if headers is None:
+            headers = {}
+        
+        # Add default API version if not specified
+        if 'x-api-version' not in headers:
+            headers['x-api-version'] = 'v1'
+        
+        key = self._cache_key(endpoint, params, headers)
+        if key is not None and key in self._cache:
+            return self._cache[key]
+        
+        result = _loads(await self._make_request_raw(endpoint, params, headers))
+        if key is not None:
+            self._cache[key] = result
+        return result
+
 # Example usage functions
-def save_response(data: Dict[str, Any], filename: str):
-    """Save API response to JSON file."""
-    output_dir = os.path.join(os.path.dirname(__file__), "..", "data", "courses_examples")
-    os.makedirs(output_dir, exist_ok=True)
+EXAMPLE_COURSE_REF = "SCN-198202248E-01-CRS-N-0027685"
+EXAMPLE_TAGGING_CODES = ['1', '2', '40']  # SFC, PET, SF Training Subsidy
+
+# <b>/</b> highlight tags in autocomplete titles
+_BOLD_RE = re.compile(r'</?b>')
+
+# Where save_response writes example output; created once at import
+OUTPUT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "courses_examples"))
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# Background writer for save_response; pending writes are flushed at exit
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="save_response")
+atexit.register(_SAVE_POOL.shutdown, wait=True)
+
+def _do_save(data: Dict[str, Any], filepath: str):
+    """Write an API response to a JSON file."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+def _do_save_raw(content: bytes, filepath: str):
+    """Write an undecoded API response body to a file."""
+    with open(filepath, 'wb') as f:
+        f.write(content)
+
+def _report_save_error(future: Future):
+    """Print the error of a failed background save, if any."""
+    error = future.exception()
+    if error is not None:
+        print(f"\n✗ Failed to save response: {error}")
+
+def save_response(data: Dict[str, Any], filename: str) -> Future:
+    """
+    Save API response to JSON file.
+    
+    The write happens on a background thread so the next request does not
+    wait on disk I/O; the returned Future completes once the file is written.
+    """
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    future = _SAVE_POOL.submit(_do_save, data, filepath)
+    future.add_done_callback(_report_save_error)
+    print(f"✓ Saving to: {filepath}")
+    return future
+
+def save_response_raw(content: bytes, filename: str) -> Future:
+    """
+    Save an undecoded API response body (see CoursesAPI._make_request_raw).
     
-    filepath = os.path.join(output_dir, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✓ Saved to: {filepath}")
+    The bytes are written unchanged, skipping JSON re-encoding; like
+    save_response, the write happens on a background thread.
+    """
+    filepath = os.path.join(OUTPUT_DIR, filename)
+    future = _SAVE_POOL.submit(_do_save_raw, content, filepath)
+    future.add_done_callback(_report_save_error)
+    print(f"✓ Saving to: {filepath}")
+    return future
+
+def _write_lines(lines: List[str]):
+    """Write display lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def _course_lines(course: Dict[str, Any], heading: str, indent: str,
+                  show_provider: bool = True, show_area: bool = True) -> List[str]:
+    """Format one course as display lines: heading, reference, provider and area."""
+    lines = [f"\n{heading}", f"{indent}Reference: {course.get('referenceNumber')}"]
+    provider = course.get('trainingProvider', {})
+    if show_provider and provider:
+        lines.append(f"{indent}Provider: {provider.get('name')}")
+    areas = course.get('areaOfTrainings', [])
+    if show_area and areas:
+        lines.append(f"{indent}Area: {areas[0].get('description')}")
+    return lines
 
-def example_1_course_categories():
+def example_1_course_categories(result: Dict[str, Any]):
     """Example 1: Retrieve course categories by keyword."""
     print("\n" + "="*80)
     print("Example 1: Get Course Categories")
     print("="*80)
     print("\nSearching for categories containing 'Training'...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_course_categories(keyword='Training')
-    
     print(f"\nFound {result.get('meta', {}).get('total', 0)} categories:")
-    for category in result.get('data', {}).get('categories', []):
-        print(f"  - ID: {category.get('id')}, Name: {category.get('name')}")
+    _write_lines([
+        f"  - ID: {category.get('id')}, Name: {category.get('name')}"
+        for category in result.get('data', {}).get('categories', [])
+    ])
     
     save_response(result, "example_1_course_categories.json")
     return result
 
-def example_2_course_tags():
+def example_2_course_tags(result: Dict[str, Any]):
     """Example 2: Retrieve course tags sorted by text."""
     print("\n" + "="*80)
     print("Example 2: Get Course Tags")
     print("="*80)
     print("\nRetrieving course tags sorted by text...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_course_tags(sort_by='0')
-    
     print(f"\nFound {result.get('meta', {}).get('total', 0)} tags:")
     tags = result.get('data', {}).get('tags', [])
-    for tag in tags[:10]:  # Show first 10 tags
-        print(f"  - {tag.get('text')}: {tag.get('count')} courses")
+    _write_lines([  # Show first 10 tags
+        f"  - {tag.get('text')}: {tag.get('count')} courses" for tag in tags[:10]
+    ])
     if len(tags) > 10:
         print(f"  ... and {len(tags) - 10} more tags")
     
     save_response(result, "example_2_course_tags.json")
     return result
 
-def example_3_search_by_keyword():
+def example_3_search_by_keyword(result: Dict[str, Any]):
     """Example 3: Search courses by keyword."""
     print("\n" + "="*80)
     print("Example 3: Search Courses by Keyword")
     print("="*80)
     print("\nSearching for 'python' courses...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.search_courses_by_keyword(keyword='python', page_size=5)
-    
     courses = result.get('data', {}).get('courses', [])
     total = result.get('data', {}).get('meta', {}).get('total', 0)
     
     print(f"\nFound {total} courses (showing first {len(courses)}):")
-    for course in courses:
-        print(f"\n  Title: {course.get('title')}")
-        print(f"  Reference: {course.get('referenceNumber')}")
-        areas = course.get('areaOfTrainings', [])
-        if areas:
-            print(f"  Area: {areas[0].get('description')}")
+    _write_lines([
+        line for course in courses
+        for line in _course_lines(course, f"  Title: {course.get('title')}", "  ",
+                                  show_provider=False)
+    ])
     
     save_response(result, "example_3_search_by_keyword.json")
     return result
 
-def example_4_search_by_tagging():
-    """Example 4: Search courses by tagging code."""
+def example_4_search_by_tagging(result: Dict[str, Any]):
+    """Example 4: Search courses by several tagging codes in one request."""
     print("\n" + "="*80)
-    print("Example 4: Search Courses by Tagging Code (SkillsFuture Credit)")
+    print("Example 4: Search Courses by Tagging Code (SFC, PET, SF Training Subsidy)")
     print("="*80)
-    print("\nSearching for SkillsFuture Credit (SFC) supported courses...")
-    
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.search_courses_by_tagging(
-        tagging_codes=['1'],  # SFC
-        support_end_date='20250101',
-        page_size=5
-    )
+    print(f"\nSearching for courses tagged {', '.join(EXAMPLE_TAGGING_CODES)} in a single request...")
     
     courses = result.get('data', {}).get('courses', [])
     total = result.get('data', {}).get('meta', {}).get('total', 0)
     
-    print(f"\nFound {total} SFC courses (showing first {len(courses)}):")
-    for course in courses:
-        print(f"\n  Title: {course.get('title')}")
-        print(f"  Reference: {course.get('referenceNumber')}")
-        provider = course.get('trainingProvider', {})
-        if provider:
-            print(f"  Provider: {provider.get('name')}")
-        areas = course.get('areaOfTrainings', [])
-        if areas:
-            print(f"  Area: {areas[0].get('description')}")
+    print(f"\nFound {total} courses (showing first {len(courses)}):")
+    _write_lines([
+        line for course in courses
+        for line in _course_lines(course, f"  Title: {course.get('title')}", "  ")
+    ])
+    
+    print("\n  Courses per tagging code (this page):")
+    _write_lines([
+        f"  - {code}: {len(tagged)}"
+        for code, tagged in group_courses_by_tagging(result, EXAMPLE_TAGGING_CODES).items()
+    ])
     
     save_response(result, "example_4_search_by_tagging.json")
     return result
 
-def example_5_autocomplete():
+def example_5_autocomplete(result: Dict[str, Any]):
     """Example 5: Get course title autocomplete suggestions."""
     print("\n" + "="*80)
     print("Example 5: Get Course Autocomplete Suggestions")
     print("="*80)
     print("\nGetting autocomplete suggestions for 'data'...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_course_autocomplete(keyword='data')
-    
     # Extract course titles from the response
     courses = result.get('data', {}).get('courses', [])
     terms = result.get('data', {}).get('terms', [])
     
     print(f"\nFound {len(courses)} course title suggestions:")
-    for i, course in enumerate(courses[:10], 1):  # Show first 10
-        # Remove HTML tags for cleaner display
-        title = course.get('title', '').replace('<b>', '').replace('</b>', '')
-        print(f"  {i}. {title}")
+    # Show first 10, removing HTML tags for cleaner display
+    _write_lines([
+        f"  {i}. {_BOLD_RE.sub('', course.get('title', ''))}"
+        for i, course in enumerate(courses[:10], 1)
+    ])
     if len(courses) > 10:
         print(f"  ... and {len(courses) - 10} more course titles")
     
@@ -524,46 +1003,34 @@ def example_5_autocomplete():
     save_response(result, "example_5_autocomplete.json")
     return result
 
-def example_6_subcategories():
+def example_6_subcategories(result: Dict[str, Any]):
     """Example 6: Retrieve course sub-categories."""
     print("\n" + "="*80)
     print("Example 6: Get Course SubCategories")
     print("="*80)
     print("\nRetrieving sub-categories for category ID 34 (Area of Training)...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_course_subcategories(browse_category_id=34)
-    
     subcategories = result.get('data', {}).get('subCategories', [])
     total = result.get('meta', {}).get('total', 0)
     
     print(f"\nFound {total} sub-categories:")
-    for i, subcat in enumerate(subcategories[:15], 1):  # Show first 15
-        print(f"  {i}. {subcat.get('description')} (ID: {subcat.get('id')})")
+    _write_lines([  # Show first 15
+        f"  {i}. {subcat.get('description')} (ID: {subcat.get('id')})"
+        for i, subcat in enumerate(subcategories[:15], 1)
+    ])
     if len(subcategories) > 15:
         print(f"  ... and {len(subcategories) - 15} more sub-categories")
     
     save_response(result, "example_6_subcategories.json")
     return result
 
-def example_7_course_details():
+def example_7_course_details(result: Dict[str, Any]):
     """Example 7: Retrieve detailed course information."""
     print("\n" + "="*80)
     print("Example 7: Get Course Details")
     print("="*80)
     
-    # Using an example course reference number
-    course_ref = "SCN-198202248E-01-CRS-N-0027685"
-    print(f"\nRetrieving details for course: {course_ref}...")
-    
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_course_details(course_reference_number=course_ref)
+    print(f"\nRetrieving details for course: {EXAMPLE_COURSE_REF}...")
     
     courses = result.get('data', {}).get('courses', [])
     if courses:
@@ -590,95 +1057,136 @@ def example_7_course_details():
     save_response(result, "example_7_course_details.json")
     return result
 
-def example_8_related_courses():
+def example_8_related_courses(result: Dict[str, Any]):
     """Example 8: Retrieve courses related to a specific course."""
     print("\n" + "="*80)
     print("Example 8: Get Related Courses")
     print("="*80)
     
-    # Using an example course reference number
-    course_ref = "SCN-198202248E-01-CRS-N-0027685"
-    print(f"\nRetrieving courses related to: {course_ref}...")
-    
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_related_courses(course_reference_number=course_ref)
+    print(f"\nRetrieving courses related to: {EXAMPLE_COURSE_REF}...")
     
     courses = result.get('data', {}).get('courses', [])
     
     print(f"\nFound {len(courses)} related courses:")
-    for i, course in enumerate(courses, 1):
-        print(f"\n  {i}. {course.get('title')}")
-        print(f"     Reference: {course.get('referenceNumber')}")
-        provider = course.get('trainingProvider', {})
-        if provider:
-            print(f"     Provider: {provider.get('name')}")
+    _write_lines([
+        line for i, course in enumerate(courses, 1)
+        for line in _course_lines(course, f"  {i}. {course.get('title')}", "     ",
+                                  show_area=False)
+    ])
     
     save_response(result, "example_8_related_courses.json")
     return result
 
-def example_9_popular_courses():
+def example_9_popular_courses(result: Dict[str, Any]):
     """Example 9: Retrieve popular/trending courses."""
     print("\n" + "="*80)
     print("Example 9: Get Popular Courses")
     print("="*80)
     print("\nRetrieving popular courses...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_popular_courses(page_size=5)
-    
     courses = result.get('data', {}).get('courses', [])
     total = result.get('data', {}).get('meta', {}).get('total', 0)
     
     print(f"\nFound {total} popular courses (showing first {len(courses)}):")
-    for i, course in enumerate(courses, 1):
-        print(f"\n  {i}. {course.get('title')}")
-        print(f"     Reference: {course.get('referenceNumber')}")
-        provider = course.get('trainingProvider', {})
-        if provider:
-            print(f"     Provider: {provider.get('name')}")
-        areas = course.get('areaOfTrainings', [])
-        if areas:
-            print(f"     Area: {areas[0].get('description')}")
+    _write_lines([
+        line for i, course in enumerate(courses, 1)
+        for line in _course_lines(course, f"  {i}. {course.get('title')}", "     ")
+    ])
     
     save_response(result, "example_9_popular_courses.json")
     return result
 
-def example_10_featured_courses():
+def example_10_featured_courses(result: Dict[str, Any]):
     """Example 10: Retrieve featured courses from MySkillsFuture."""
     print("\n" + "="*80)
     print("Example 10: Get Featured Courses")
     print("="*80)
     print("\nRetrieving featured courses from MySkillsFuture...")
     
-    cert_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-    key_path = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
-    
-    api = CoursesAPI(cert_path, key_path)
-    result = api.get_featured_courses(page_size=5)
-    
     courses = result.get('data', {}).get('courses', [])
     total = result.get('data', {}).get('meta', {}).get('total', 0)
     
     print(f"\nFound {total} featured courses (showing first {len(courses)}):")
-    for i, course in enumerate(courses, 1):
-        print(f"\n  {i}. {course.get('title')}")
-        print(f"     Reference: {course.get('referenceNumber')}")
-        provider = course.get('trainingProvider', {})
-        if provider:
-            print(f"     Provider: {provider.get('name')}")
-        areas = course.get('areaOfTrainings', [])
-        if areas:
-            print(f"     Area: {areas[0].get('description')}")
+    _write_lines([
+        line for i, course in enumerate(courses, 1)
+        for line in _course_lines(course, f"  {i}. {course.get('title')}", "     ")
+    ])
     
     save_response(result, "example_10_featured_courses.json")
     return result
 
+# (number, name, request, display) - the request works with either
+# CoursesAPI or AsyncCoursesAPI, the display function renders its result.
+EXAMPLES = [
+    ("1", "Course Categories",
+     lambda api: api.get_course_categories(keyword='Training'),
+     example_1_course_categories),
+    ("2", "Course Tags",
+     lambda api: api.get_course_tags(sort_by='0'),
+     example_2_course_tags),
+    ("3", "Search by Keyword",
+     lambda api: api.search_courses_by_keyword(keyword='python', page_size=5),
+     example_3_search_by_keyword),
+    ("4", "Search by Tagging",
+     lambda api: api.search_courses_by_tagging(
+         tagging_codes=EXAMPLE_TAGGING_CODES,
+         support_end_date='20250101',
+         page_size=5
+     ),
+     example_4_search_by_tagging),
+    ("5", "Autocomplete",
+     lambda api: api.get_course_autocomplete(keyword='data'),
+     example_5_autocomplete),
+    ("6", "Course SubCategories",
+     lambda api: api.get_course_subcategories(browse_category_id=34),
+     example_6_subcategories),
+    ("7", "Course Details",
+     lambda api: api.get_course_details(course_reference_number=EXAMPLE_COURSE_REF),
+     example_7_course_details),
+    ("8", "Related Courses",
+     lambda api: api.get_related_courses(course_reference_number=EXAMPLE_COURSE_REF),
+     example_8_related_courses),
+    ("9", "Popular Courses",
+     lambda api: api.get_popular_courses(page_size=5),
+     example_9_popular_courses),
+    ("10", "Featured Courses",
+     lambda api: api.get_featured_courses(page_size=5),
+     example_10_featured_courses),
+]
+EXAMPLES_BY_NUMBER = {num: (request, func) for num, _, request, func in EXAMPLES}
+
+@functools.lru_cache(maxsize=None)
+def get_shared_api() -> CoursesAPI:
+    """Return the CoursesAPI (and session) shared by all examples, creating it on first use."""
+    return CoursesAPI(CERT_PATH, KEY_PATH)
+
+def with_api(func):
+    """Decorator that passes the shared CoursesAPI as the first argument."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(get_shared_api(), *args, **kwargs)
+    return wrapper
+
+@with_api
+def run_example(api: CoursesAPI, number: str) -> Dict[str, Any]:
+    """
+    Run a single example by its menu number, e.g. run_example("3").
+    
+    Returns:
+        The API response the example displayed
+    """
+    request, func = EXAMPLES_BY_NUMBER[number]
+    return func(request(api))
+
+async def _fetch_all_async(cert_path: str, key_path: str, requests_to_run,
+                           cache: Optional[TTLCache] = None) -> List[Any]:
+    """Issue every example request concurrently; failures are returned, not raised."""
+    async with AsyncCoursesAPI(cert_path, key_path, cache=cache) as api:
+        return await asyncio.gather(
+            *(request(api) for request in requests_to_run),
+            return_exceptions=True
+        )
+
 def run_all_examples():
     """Run all Courses API examples."""
     print("\n" + "="*80)
@@ -688,24 +1196,19 @@ def run_all_examples():
     print("Authentication: Certificate-based (mTLS)")
     print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
-    examples = [
-        ("1", "Course Categories", example_1_course_categories),
-        ("2", "Course Tags", example_2_course_tags),
-        ("3", "Search by Keyword", example_3_search_by_keyword),
-        ("4", "Search by Tagging", example_4_search_by_tagging),
-        ("5", "Autocomplete", example_5_autocomplete),
-        ("6", "Course SubCategories", example_6_subcategories),
-        ("7", "Course Details", example_7_course_details),
-        ("8", "Related Courses", example_8_related_courses),
-        ("9", "Popular Courses", example_9_popular_courses),
-        ("10", "Featured Courses", example_10_featured_courses),
-    ]
+    # One client (and one requests.Session) for every example, so the mTLS
+    # handshake is paid once and the pooled connection is reused.
+    try:
+        api = get_shared_api()
+    except (OSError, ssl.SSLError) as e:
+        print(f"\n✗ Failed to load client certificate: {e}")
+        return
     
     while True:
         print("\n" + "="*80)
         print("Available Examples:")
         print("="*80)
-        for num, name, _ in examples:
+        for num, name, _, _ in EXAMPLES:
             print(f"  {num}. {name}")
         print("  0. Run all examples")
         print("  q. Quit")
@@ -716,22 +1219,38 @@ def run_all_examples():
             print("\nExiting...")
             break
         elif choice == '0':
-            for _, _, func in examples:
+            if httpx is not None:
+                # Fire all requests at once, then render results in order.
+                # The async client is rebuilt per run, so it borrows the shared
+                # client's cache to keep responses across repeated runs.
+                results = asyncio.run(_fetch_all_async(
+                    CERT_PATH, KEY_PATH, [request for _, _, request, _ in EXAMPLES],
+                    cache=api._cache
+                ))
+            else:
+                results = []
+                for _, _, request, _ in EXAMPLES:
+                    try:
+                        results.append(request(api))
+                    except Exception as e:
+                        results.append(e)
+            
+            for (_, _, _, func), result in zip(EXAMPLES, results):
+                if isinstance(result, Exception):
+                    print(f"\n✗ Error: {str(result)}")
+                    continue
                 try:
-                    func()
+                    func(result)
                 except Exception as e:
                     print(f"\n✗ Error: {str(e)}")
             print("\n" + "="*80)
             print("All examples completed!")
             print("="*80)
-        elif choice in [num for num, _, _ in examples]:
-            for num, _, func in examples:
-                if num == choice:
-                    try:
-                        func()
-                    except Exception as e:
-                        print(f"\n✗ Error: {str(e)}")
-                    break
+        elif choice in EXAMPLES_BY_NUMBER:
+            try:
+                run_example(choice)
+            except Exception as e:
+                print(f"\n✗ Error: {str(e)}")
         else:
             print("\n✗ Invalid choice. Please try again.")
 
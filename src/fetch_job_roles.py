@@ -11,14 +11,29 @@ Date: October 2025
 import requests
 import json
 import os
-from datetime import datetime
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Iterator
+
+from api_common import buffered_logger, cert_tuple
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Optional: only needed for iter_job_roles
+    ijson = None
+
+logger = buffered_logger(__name__)
 
 
 def fetch_job_roles_data(
     api_url: str = "https://api.ssg-wsg.sg/skillsFramework/jobRoles",
     cert_path: str = "cert.pem",
-    key_path: str = "key.pem"
+    key_path: str = "key.pem",
+    session: Optional[requests.Session] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Fetch job roles data from the Skills Framework API using certificate authentication.
@@ -27,6 +42,8 @@ def fetch_job_roles_data(
     api_url (str): The API endpoint URL for job roles data
     cert_path (str): Path to the certificate file
     key_path (str): Path to the private key file
+    session (Optional[requests.Session]): Session to reuse across repeated calls,
+        keeping the connection alive; a one-off request is made if None
     
     Returns:
     Optional[Dict[str, Any]]: The JSON response data if successful, None if failed
@@ -36,50 +53,68 @@ def fetch_job_roles_data(
     FileNotFoundError: If certificate or key files are not found
     """
     try:
-        # Verify certificate files exist
-        if not os.path.exists(cert_path):
-            raise FileNotFoundError(f"Certificate file not found: {cert_path}")
-        if not os.path.exists(key_path):
-            raise FileNotFoundError(f"Key file not found: {key_path}")
+        # Verify certificate files exist (checked once per path pair)
+        cert = cert_tuple(cert_path, key_path)
         
-        print("Fetching job roles data from Skills Framework API...")
-        print(f"API URL: {api_url}")
+        logger.debug("Fetching job roles data from Skills Framework API...")
+        logger.debug("API URL: %s", api_url)
         
         # Make the API request with certificate authentication
-        response = requests.get(
+        response = (session or requests).get(
             api_url,
-            cert=(cert_path, key_path),
+            cert=cert,
             timeout=30  # 30 second timeout
         )
         
         # Check if request was successful
         response.raise_for_status()
         
-        print(f"Status Code: {response.status_code}")
-        print("Data fetched successfully!")
+        logger.debug("Status Code: %s", response.status_code)
+        logger.debug("Data fetched successfully!")
         
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
         
     except FileNotFoundError as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
         return None
     except requests.exceptions.Timeout:
-        print("Error: Request timed out. Please try again.")
+        logger.error("Error: Request timed out. Please try again.")
         return None
     except requests.exceptions.ConnectionError:
-        print("Error: Failed to connect to the API. Please check your internet connection.")
+        logger.error("Error: Failed to connect to the API. Please check your internet connection.")
         return None
     except requests.exceptions.HTTPError as e:
-        print(f"Error: HTTP {response.status_code} - {e}")
+        logger.error("Error: HTTP %s - %s", response.status_code, e)
         return None
     except requests.exceptions.RequestException as e:
-        print(f"Error: Request failed - {e}")
+        logger.error("Error: Request failed - %s", e)
         return None
     except json.JSONDecodeError:
-        print("Error: Invalid JSON response from API")
+        logger.error("Error: Invalid JSON response from API")
         return None
 
 
+def _write_bytes(file_path: str, buf: bytes) -> None:
+    """
+    Write bytes to a file with os.write, looping over partial writes.
+    
+    The file is written once and rarely re-read, so on platforms that support
+    it the kernel is told to drop the written pages from the page cache.
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, len(buf), os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
 def save_json_data(
     data: Dict[str, Any],
     filename: Optional[str] = None,
@@ -102,43 +137,95 @@ def save_json_data(
         
         # Generate filename if not provided
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"job_roles_data_{timestamp}.json"
         
         # Ensure filename has .json extension
         if not filename.endswith('.json'):
             filename += '.json'
         
-        file_path = os.path.join(output_dir, filename)
+        file_path = f"{output_dir.rstrip(os.sep)}{os.sep}{filename}"
         
-        # Save data as formatted JSON
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(
+        # Serialize straight to UTF-8 bytes and write them through a raw
+        # file descriptor, skipping the text-mode encoding layer
+        if orjson is not None:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            buf = json.dumps(
                 data,
-                f,
                 indent=2,
                 ensure_ascii=False,
                 separators=(',', ': ')
-            )
+            ).encode('utf-8')
+        _write_bytes(file_path, buf)
         
         print(f"Data saved successfully to: {file_path}")
         
         # Print some basic statistics about the data
         if isinstance(data, dict):
-            print(f"Number of top-level keys: {len(data.keys())}")
+            logger.debug("Number of top-level keys: %d", len(data.keys()))
             if 'data' in data and isinstance(data['data'], list):
-                print(f"Number of job roles: {len(data['data'])}")
+                logger.debug("Number of job roles: %d", len(data['data']))
         
         return True
         
     except OSError as e:
-        print(f"Error: Failed to create directory or write file - {e}")
+        logger.error("Error: Failed to create directory or write file - %s", e)
         return False
     except Exception as e:
-        print(f"Error: Failed to save JSON data - {e}")
+        logger.error("Error: Failed to save JSON data - %s", e)
         return False
 
 
+def load_job_roles_data(file_path: str) -> Dict[str, Any]:
+    """
+    Load a saved job roles JSON file in full.
+    
+    Parameters:
+    file_path (str): Path to a file written by save_json_data
+    
+    Returns:
+    Dict[str, Any]: The parsed response
+    """
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def iter_job_roles(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the job roles in a saved JSON file one at a time.
+    
+    The file is parsed incrementally with ijson, so memory use stays flat
+    regardless of file size. Use load_job_roles_data when the whole
+    response is needed.
+    Requires: pip install ijson
+    
+    Parameters:
+    file_path (str): Path to a file written by save_json_data
+    
+    Yields:
+    Dict[str, Any]: Each job role in the response's "data.jobRoles" list
+    (or in "data" itself, if the response holds a bare list)
+    """
+    if ijson is None:
+        raise ImportError("iter_job_roles requires ijson: pip install ijson")
+    
+    with open(file_path, 'rb') as f:
+        # Documented shape is {"data": {"jobRoles": [...]}}; peek at how
+        # "data" opens, then rewind and stream the roles from the right path
+        prefix = 'data.jobRoles.item'
+        for path, event, _ in ijson.parse(f):
+            if path == 'data' and event in ('start_map', 'start_array'):
+                if event == 'start_array':
+                    prefix = 'data.item'
+                break
+        f.seek(0)
+        yield from ijson.items(f, prefix)
+
+
 def main() -> None:
     """
     Main function to orchestrate the data fetching and saving process.
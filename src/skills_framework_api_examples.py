@@ -29,72 +29,108 @@ Date: October 2025
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import argparse
+import functools
+import importlib.util
+import io
 import json
 import os
-from typing import Dict, Any, Optional, List
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Iterator, TextIO
 from datetime import datetime
 
+from api_common import buffered_logger, cert_tuple, client_ssl_context
 
-class SkillsFrameworkAPI:
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: only needed for typed decoding (schema=...)
+    msgspec = None
+
+try:
+    import httpx
+except ImportError:  # Optional: only needed for AsyncSkillsFrameworkAPI
+    httpx = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional: responses are then fetched on every run
+    requests_cache = None
+
+# httpx only speaks HTTP/2 when the h2 package is present (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# On-disk response cache shared across runs (used when requests-cache is installed)
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "skills_framework_cache")
+HTTP_CACHE_EXPIRY = 3600
+
+logger = buffered_logger(__name__)
+
+
+if msgspec is not None:
+    # Typed view of a job roles search response for get_job_roles(schema=...).
+    # Fields not declared here are skipped while decoding.
+    class JobRole(msgspec.Struct):
+        id: Optional[str] = None
+        code: Optional[str] = None
+        title: Optional[str] = None
+        description: Optional[str] = None
+    
+    class JobRolesData(msgspec.Struct):
+        jobRoles: List[JobRole] = []
+    
+    class JobRolesResponse(msgspec.Struct):
+        data: JobRolesData = msgspec.field(default_factory=JobRolesData)
+        meta: Dict[str, Any] = {}
+        status: Any = None
+else:
+    JobRole = JobRolesData = JobRolesResponse = None
+
+
+def _decode(content: bytes, schema: Optional[type] = None) -> Any:
+    """Parse a JSON response body, into `schema` with msgspec if one is given."""
+    if schema is not None:
+        if msgspec is None:
+            raise ImportError("typed decoding requires msgspec: pip install msgspec")
+        return msgspec.json.decode(content, type=schema)
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+class JobRolesPageError(RuntimeError):
+    """A page of a job roles search could not be fetched (see the logged error)."""
+    
+    def __init__(self, page: int):
+        super().__init__(f"Failed to fetch job roles page {page}")
+        self.page = page
+
+
+class _SkillsFrameworkAPIBase:
     """
-    A client for the Singapore Skills Framework API (Certificate Authentication).
+    Endpoint URLs and methods shared by SkillsFrameworkAPI and AsyncSkillsFrameworkAPI.
     
-    This class provides methods to interact with certificate-authenticated endpoints.
-    Only includes endpoints that are confirmed to work with certificate authentication.
+    Each endpoint method returns self._make_request(...), which the subclasses
+    implement; blocking-only helpers such as iter_all_job_roles live on
+    SkillsFrameworkAPI.
     """
     
     BASE_URL = "https://api.ssg-wsg.sg/skillsFramework"
     
-    def __init__(self, cert_path: str = "certificates/cert.pem", key_path: str = "certificates/key.pem"):
-        """
-        Initialize the API client with certificate paths.
-        
-        Parameters:
-        cert_path (str): Path to the certificate file
-        key_path (str): Path to the private key file
-        """
-        self.cert_path = cert_path
-        self.key_path = key_path
-        self.cert = (cert_path, key_path)
-        
-        # Verify certificate files exist
-        if not os.path.exists(cert_path):
-            raise FileNotFoundError(f"Certificate file not found: {cert_path}")
-        if not os.path.exists(key_path):
-            raise FileNotFoundError(f"Key file not found: {key_path}")
-    
-    def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
-        """
-        Make an authenticated API request.
-        
-        Parameters:
-        endpoint (str): API endpoint path
-        params (Optional[Dict[str, Any]]): Query parameters
-        
-        Returns:
-        Optional[Dict[str, Any]]: JSON response or None if failed
-        """
-        url = f"{self.BASE_URL}/{endpoint}"
-        
-        try:
-            print(f"Requesting: {url}")
-            if params:
-                print(f"Parameters: {params}")
-            
-            response = requests.get(
-                url,
-                cert=self.cert,
-                params=params,
-                timeout=30
-            )
-            
-            response.raise_for_status()
-            print(f"✓ Status: {response.status_code}")
-            return response.json()
-            
-        except requests.exceptions.RequestException as e:
-            print(f"✗ Error: {e}")
-            return None
+    # Full URLs of the certificate-authenticated endpoints
+    URL_JOB_ROLES = BASE_URL + "/jobRoles"
+    URL_JOB_ROLE_TITLES = BASE_URL + "/jobRoles/titles"
+    URL_CCS = BASE_URL + "/codes/skillsAndCompetencies/generic/autocomplete"
+    URL_TSC = BASE_URL + "/codes/skillsAndCompetencies/technical/autocomplete"
+    URL_TSC_DETAILS = URL_TSC + "/details"
+    URL_CCS_DETAILS = URL_CCS + "/details"
     
     # ========== Job Roles APIs (Certificate Auth - WORKING) ==========
     
@@ -105,8 +141,9 @@ class SkillsFrameworkAPI:
         qualification: Optional[str] = None,
         field_of_study: Optional[str] = None,
         page: int = 0,
-        page_size: int = 20
-    ) -> Optional[Dict[str, Any]]:
+        page_size: int = 20,
+        schema: Optional[type] = None
+    ) -> Optional[Any]:
         """
         Search job roles based on various criteria.
         
@@ -117,24 +154,27 @@ class SkillsFrameworkAPI:
         field_of_study (str): Filter by field of study ID (use comma delimiter for multiple)
         page (int): Page number starting from 0
         page_size (int): Number of results per page (default 20, max 100)
+        schema (Optional[type]): Decode into this msgspec type (e.g. JobRolesResponse)
+                                 instead of a dict; requires msgspec
         
         Returns:
         Job roles with details including code, description, qualifications, sectors, etc.
         """
+        # Unset (None or empty) filters are left out of the query string
         params: Dict[str, Any] = {
-            "page": page,
-            "pageSize": page_size
+            name: value
+            for name, value in (
+                ("page", page),
+                ("pageSize", page_size),
+                ("keyword", keyword),
+                ("sector", sector),
+                ("qualification", qualification),
+                ("fieldOfStudy", field_of_study),
+            )
+            if value is not None and value != ""
         }
-        if keyword:
-            params["keyword"] = keyword
-        if sector:
-            params["sector"] = sector
-        if qualification:
-            params["qualification"] = qualification
-        if field_of_study:
-            params["fieldOfStudy"] = field_of_study
         
-        return self._make_request("jobRoles", params)
+        return self._make_request(self.URL_JOB_ROLES, params, schema)
     
     def get_job_role_titles(self, keyword: str) -> Optional[Dict[str, Any]]:
         """
@@ -148,7 +188,7 @@ class SkillsFrameworkAPI:
         Up to 5 matching job role titles with score, title, alternative title, etc.
         """
         params: Dict[str, Any] = {"keyword": keyword}
-        return self._make_request("jobRoles/titles", params)
+        return self._make_request(self.URL_JOB_ROLE_TITLES, params)
     
     # ========== Skills & Competencies APIs (Certificate Auth - WORKING) ==========
     
@@ -166,7 +206,7 @@ class SkillsFrameworkAPI:
         Note: Keywords with spaces may cause 500 errors. Use single words or hyphens.
         """
         params: Dict[str, Any] = {"keyword": keyword}
-        return self._make_request("codes/skillsAndCompetencies/generic/autocomplete", params)
+        return self._make_request(self.URL_CCS, params)
     
     def get_tsc_technical_skills(self, keyword: str) -> Optional[Dict[str, Any]]:
         """
@@ -187,7 +227,7 @@ class SkillsFrameworkAPI:
         - May return 404 if no matching TSC codes found for the keyword.
         """
         params: Dict[str, Any] = {"keyword": keyword}
-        return self._make_request("codes/skillsAndCompetencies/technical/autocomplete", params)
+        return self._make_request(self.URL_TSC, params)
     
     def get_tsc_autocomplete_details(self, keyword: str) -> Optional[Dict[str, Any]]:
         """
@@ -208,7 +248,7 @@ class SkillsFrameworkAPI:
         - May return 404 if no matching TSC codes found for the keyword.
         """
         params: Dict[str, Any] = {"keyword": keyword}
-        return self._make_request("codes/skillsAndCompetencies/technical/autocomplete/details", params)
+        return self._make_request(self.URL_TSC_DETAILS, params)
     
     def get_ccs_autocomplete_details(self, keyword: str) -> Optional[Dict[str, Any]]:
         """
@@ -229,50 +269,278 @@ class SkillsFrameworkAPI:
         - May return 404 if no matching codes found for the keyword.
         """
         params: Dict[str, Any] = {"keyword": keyword}
-        return self._make_request("codes/skillsAndCompetencies/generic/autocomplete/details", params)
+        return self._make_request(self.URL_CCS_DETAILS, params)
+
+
+class SkillsFrameworkAPI(_SkillsFrameworkAPIBase):
+    """
+    A client for the Singapore Skills Framework API (Certificate Authentication).
+    
+    This class provides methods to interact with certificate-authenticated endpoints.
+    Only includes endpoints that are confirmed to work with certificate authentication.
+    """
+    
+    def __init__(
+        self,
+        cert_path: str = "certificates/cert.pem",
+        key_path: str = "certificates/key.pem",
+        use_cache: bool = True
+    ):
+        """
+        Initialize the API client with certificate paths.
+        
+        Parameters:
+        cert_path (str): Path to the certificate file
+        key_path (str): Path to the private key file
+        use_cache (bool): Cache responses on disk (when requests-cache is installed)
+        """
+        self.cert_path = cert_path
+        self.key_path = key_path
+        # Verify certificate files exist (checked once per path pair)
+        self.cert = cert_tuple(cert_path, key_path)
+        
+        # Reuse one session so the TCP + mTLS handshake is paid once,
+        # not on every request. With requests-cache installed, repeated
+        # queries are answered from a SQLite cache for an hour.
+        if use_cache and requests_cache is not None:
+            self.session = requests_cache.CachedSession(
+                HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=HTTP_CACHE_EXPIRY,
+                allowable_methods=('GET',)
+            )
+        else:
+            self.session = requests.Session()
+        self.session.cert = self.cert
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self.session.close()
+    
+    def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        schema: Optional[type] = None
+    ) -> Optional[Any]:
+        """
+        Make an authenticated API request.
+        
+        Parameters:
+        url (str): Full endpoint URL (one of the URL_* constants)
+        params (Optional[Dict[str, Any]]): Query parameters
+        schema (Optional[type]): msgspec type to decode into instead of a dict
+        
+        Returns:
+        Optional[Any]: JSON response (a dict, or a schema instance) or None if failed
+        """
+        try:
+            logger.debug("Requesting: %s", url)
+            if params:
+                logger.debug("Parameters: %s", params)
+            
+            response = self.session.get(
+                url,
+                params=params,
+                timeout=30
+            )
+            
+            response.raise_for_status()
+            logger.debug("✓ Status: %s", response.status_code)
+            return _decode(response.content, schema)
+            
+        except requests.exceptions.RequestException as e:
+            logger.error("✗ Error: %s", e)
+            return None
+        except ValueError as e:
+            # orjson.JSONDecodeError is not a RequestException
+            logger.error("✗ Error: Invalid JSON response - %s", e)
+            return None
+    
+    def iter_all_job_roles(
+        self,
+        prefetch: int = 2,
+        page_size: int = 20,
+        **filters: Any
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every page of a job roles search.
+        
+        Keeps `prefetch` page requests in flight on a thread pool, so the next
+        page is already being fetched while the caller processes this one.
+        Stops after the first short page.
+        
+        Parameters:
+        prefetch (int): Number of page requests kept in flight
+        page_size (int): Number of results per page (max 100)
+        **filters: Search criteria passed on to get_job_roles (keyword, sector, ...)
+        
+        Yields:
+        Dict[str, Any]: Each page's response, in page order
+        
+        Raises:
+        JobRolesPageError: If a page request fails, so a partial listing is
+                           never mistaken for a complete one
+        """
+        def fetch(page: int):
+            return page, executor.submit(self.get_job_roles, page=page, page_size=page_size, **filters)
+        
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque(fetch(page) for page in range(prefetch))
+            next_page = prefetch
+            try:
+                while pending:
+                    page, future = pending.popleft()
+                    result = future.result()
+                    if result is None:
+                        raise JobRolesPageError(page)
+                    data = result.get('data')
+                    roles = data.get('jobRoles', []) if isinstance(data, dict) else data or []
+                    has_more = len(roles) >= page_size
+                    if has_more:
+                        pending.append(fetch(next_page))
+                        next_page += 1
+                    yield result
+                    if not has_more:
+                        return
+            finally:
+                # Done or stopped early: drop the speculative requests not yet started
+                for _, future in pending:
+                    future.cancel()
+
+
+class AsyncSkillsFrameworkAPI(_SkillsFrameworkAPIBase):
+    """
+    Asynchronous client for the Skills Framework API, built on httpx.AsyncClient.
+    
+    Provides the same endpoint methods as SkillsFrameworkAPI (but not its
+    blocking helpers such as iter_all_job_roles); since they all return
+    self._make_request(...), here they return coroutines to await.
+    Independent calls can be gathered with asyncio.gather() and multiplexed
+    over one HTTP/2 connection (when h2 is installed).
+    
+    Requires: pip install "httpx[http2]"
+    """
+    
+    def __init__(self, cert_path: str = "certificates/cert.pem", key_path: str = "certificates/key.pem"):
+        """
+        Initialize the async API client with certificate paths.
+        
+        Parameters:
+        cert_path (str): Path to the certificate file
+        key_path (str): Path to the private key file
+        """
+        if httpx is None:
+            raise ImportError("AsyncSkillsFrameworkAPI requires httpx: pip install \"httpx[http2]\"")
+        
+        self.cert_path = cert_path
+        self.key_path = key_path
+        # Verify certificate files exist (checked once per path pair)
+        self.cert = cert_tuple(cert_path, key_path)
+        
+        # httpx takes the client certificate through an SSLContext (its cert=
+        # argument is deprecated); the context is built once per cert/key pair
+        self.client = httpx.AsyncClient(
+            verify=client_ssl_context(cert_path, key_path),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            timeout=30
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        await self.client.aclose()
+    
+    async def _make_request(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        schema: Optional[type] = None
+    ) -> Optional[Any]:
+        """
+        Make an authenticated API request.
+        
+        Parameters:
+        url (str): Full endpoint URL (one of the URL_* constants)
+        params (Optional[Dict[str, Any]]): Query parameters
+        schema (Optional[type]): msgspec type to decode into instead of a dict
+        
+        Returns:
+        Optional[Any]: JSON response (a dict, or a schema instance) or None if failed
+        """
+        try:
+            logger.debug("Requesting: %s", url)
+            if params:
+                logger.debug("Parameters: %s", params)
+            
+            response = await self.client.get(url, params=params)
+            
+            response.raise_for_status()
+            logger.debug("✓ Status: %s", response.status_code)
+            return _decode(response.content, schema)
+            
+        except httpx.HTTPError as e:
+            logger.error("✗ Error: %s", e)
+            return None
+        except ValueError as e:
+            logger.error("✗ Error: Invalid JSON response - %s", e)
+            return None
 
 
 # ========== Example Usage Functions ==========
 
-def example_1_search_job_roles():
+def example_1_search_job_roles(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 1: Search for job roles with keyword."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 1: Search Job Roles by Keyword")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 1: Search Job Roles by Keyword", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Search for data-related job roles
     result = api.get_job_roles(keyword="data", page_size=5)
     
     if result:
-        print("\nFound job roles related to 'data':")
-        save_example_output("example_1_job_roles_search.json", result)
+        print("\nFound job roles related to 'data':", file=out)
+        save_example_output("example_1_job_roles_search.json", result, out)
 
 
-def example_2_autocomplete_job_titles():
+def example_2_autocomplete_job_titles(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 2: Use job role title autocomplete."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 2: Job Role Title Autocomplete")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 2: Job Role Title Autocomplete", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Autocomplete for "data"
     result = api.get_job_role_titles(keyword="data")
     
     if result:
-        print("\nAutocomplete suggestions for 'data':")
-        save_example_output("example_2_job_title_autocomplete.json", result)
+        print("\nAutocomplete suggestions for 'data':", file=out)
+        save_example_output("example_2_job_title_autocomplete.json", result, out)
 
 
-def example_3_search_technical_skills():
+def example_3_search_technical_skills(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 3: Search for technical skills (TSC)."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 3: Search Technical Skills")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 3: Search Technical Skills", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Search for data-related technical skills
     # Note: TSC codes are skill categories (e.g., "Data Analysis", "Programming")
@@ -280,34 +548,34 @@ def example_3_search_technical_skills():
     result = api.get_tsc_technical_skills(keyword="data")
     
     if result:
-        print("\nTechnical skills related to 'data':")
-        print(f"Found {result.get('meta', {}).get('total', 0)} TSC codes")
-        save_example_output("example_3_technical_skills.json", result)
+        print("\nTechnical skills related to 'data':", file=out)
+        print(f"Found {result.get('meta', {}).get('total', 0)} TSC codes", file=out)
+        save_example_output("example_3_technical_skills.json", result, out)
 
 
-def example_4_search_core_skills():
+def example_4_search_core_skills(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 4: Search for critical core skills (CCS)."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 4: Search Critical Core Skills")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 4: Search Critical Core Skills", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Search for communication skills
     result = api.get_ccs_generic_skills(keyword="communication")
     
     if result:
-        print("\nCritical core skills related to 'communication':")
-        save_example_output("example_4_core_skills.json", result)
+        print("\nCritical core skills related to 'communication':", file=out)
+        save_example_output("example_4_core_skills.json", result, out)
 
 
-def example_5_advanced_job_search():
+def example_5_advanced_job_search(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 5: Advanced job role search with multiple filters."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 5: Advanced Job Role Search")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 5: Advanced Job Role Search", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Search with multiple criteria
     result = api.get_job_roles(
@@ -317,93 +585,133 @@ def example_5_advanced_job_search():
     )
     
     if result:
-        print("\nJob roles matching criteria:")
-        print("- Keyword: engineer")
-        print("- Qualification: Degree")
-        save_example_output("example_5_advanced_search.json", result)
+        print("\nJob roles matching criteria:", file=out)
+        print("- Keyword: engineer", file=out)
+        print("- Qualification: Degree", file=out)
+        save_example_output("example_5_advanced_search.json", result, out)
 
 
-def example_6_tsc_autocomplete_details():
+def example_6_tsc_autocomplete_details(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 6: Get detailed TSC skill information."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 6: TSC Autocomplete with Detailed Information")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 6: TSC Autocomplete with Detailed Information", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Get detailed information about technical skills
     result = api.get_tsc_autocomplete_details(keyword="data")
     
     if result:
-        print("\nDetailed technical skill information for 'data':")
+        print("\nDetailed technical skill information for 'data':", file=out)
         if result.get('data') and result['data'].get('technicalSkillCompetencies'):
             skills = result['data']['technicalSkillCompetencies']
-            print(f"Found {len(skills)} detailed TSC entries")
-        save_example_output("example_6_tsc_details.json", result)
+            print(f"Found {len(skills)} detailed TSC entries", file=out)
+        save_example_output("example_6_tsc_details.json", result, out)
 
 
-def example_7_ccs_autocomplete_details():
+def example_7_ccs_autocomplete_details(api: Optional[SkillsFrameworkAPI] = None, out: Optional[TextIO] = None):
     """Example 7: Get detailed CCS/GSC skill information."""
-    print("\n" + "=" * 80)
-    print("EXAMPLE 7: CCS Autocomplete with Detailed Information")
-    print("=" * 80)
+    print("\n" + "=" * 80, file=out)
+    print("EXAMPLE 7: CCS Autocomplete with Detailed Information", file=out)
+    print("=" * 80, file=out)
     
-    api = SkillsFrameworkAPI()
+    api = api or SkillsFrameworkAPI()
     
     # Get detailed information about generic/core skills
     result = api.get_ccs_autocomplete_details(keyword="comm")
     
     if result:
-        print("\nDetailed generic skill information for 'comm':")
+        print("\nDetailed generic skill information for 'comm':", file=out)
         if result.get('data') and result['data'].get('genericSkillCompetencies'):
             skills = result['data']['genericSkillCompetencies']
-            print(f"Found {len(skills)} detailed CCS entries")
-        save_example_output("example_7_ccs_details.json", result)
+            print(f"Found {len(skills)} detailed CCS entries", file=out)
+        save_example_output("example_7_ccs_details.json", result, out)
 
 
-def save_example_output(filename: str, data: Dict[str, Any]) -> None:
-    """Save example output to a JSON file."""
+def save_example_output(filename: str, data: Dict[str, Any], out: Optional[TextIO] = None) -> None:
+    """Save example output to a JSON file and report the path on out (default: stdout)."""
     output_dir = "data/skills_framework_examples"
     os.makedirs(output_dir, exist_ok=True)
     
     file_path = os.path.join(output_dir, filename)
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        buf = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
     
-    print(f"✓ Saved to: {file_path}")
+    with open(file_path, 'wb') as f:
+        f.write(buf)
+    
+    print(f"✓ Saved to: {file_path}", file=out)
 
 
-def run_all_examples():
-    """Run all example functions."""
+def run_in_parallel(tasks: List[Callable[..., Any]], max_workers: Optional[int] = None) -> List[Any]:
+    """
+    Run independent I/O-bound tasks concurrently on a thread pool.
+    
+    Each task is called as task(out=buffer) with its own text buffer to
+    print into; the buffers are written to stdout as one block each, in the
+    order the tasks were given, so concurrent output does not interleave.
+    
+    Parameters:
+    tasks (List[Callable[..., Any]]): Callables taking an out= stream keyword
+    max_workers (Optional[int]): Thread count (default: one per task)
+    
+    Returns:
+    List[Any]: Each task's return value, in task order
+    """
+    def run(task):
+        buf = io.StringIO()
+        return task(out=buf), buf.getvalue()
+    
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers or len(tasks) or 1) as executor:
+        for result, output in executor.map(run, tasks):
+            sys.stdout.write(output)
+            results.append(result)
+    return results
+
+
+# Example number -> example function, for the CLI and run_all_examples
+EXAMPLES: Dict[int, Callable] = {
+    1: example_1_search_job_roles,
+    2: example_2_autocomplete_job_titles,
+    3: example_3_search_technical_skills,
+    4: example_4_search_core_skills,
+    5: example_5_advanced_job_search,
+    6: example_6_tsc_autocomplete_details,
+    7: example_7_ccs_autocomplete_details,
+}
+
+
+def run_all_examples(api: SkillsFrameworkAPI):
+    """Run all example functions concurrently, sharing one API client."""
     print("\n" + "=" * 80)
     print("SKILLS FRAMEWORK API - CERTIFICATE AUTHENTICATION EXAMPLES")
     print("=" * 80)
     print("\nRunning all working examples...")
     
-    examples = [
-        example_1_search_job_roles,
-        example_2_autocomplete_job_titles,
-        example_3_search_technical_skills,
-        example_4_search_core_skills,
-        example_5_advanced_job_search,
-        example_6_tsc_autocomplete_details,
-        example_7_ccs_autocomplete_details,
-    ]
-    
-    for i, example_func in enumerate(examples, 1):
+    def run_example(i: int, example_func: Callable, out: TextIO) -> None:
         try:
-            example_func()
+            example_func(api, out)
         except Exception as e:
-            print(f"\n✗ Error in example {i}: {e}")
+            print(f"\n✗ Error in example {i}: {e}", file=out)
+    
+    # The session's connection pool is shared by the worker threads
+    run_in_parallel([
+        functools.partial(run_example, i, example_func)
+        for i, example_func in EXAMPLES.items()
+    ])
     
     print("\n" + "=" * 80)
     print("ALL EXAMPLES COMPLETED")
     print("=" * 80)
 
 
-def main():
-    """Main function with menu for running examples."""
+def interactive_menu(api: SkillsFrameworkAPI):
+    """Interactive menu for picking examples to run with one API client."""
     print("\n" + "=" * 80)
     print("SKILLS FRAMEWORK API - CERTIFICATE AUTHENTICATION EXAMPLES")
     print("=" * 80)
@@ -426,24 +734,48 @@ def main():
             break
         
         if choice == '0':
-            run_all_examples()
-        elif choice == '1':
-            example_1_search_job_roles()
-        elif choice == '2':
-            example_2_autocomplete_job_titles()
-        elif choice == '3':
-            example_3_search_technical_skills()
-        elif choice == '4':
-            example_4_search_core_skills()
-        elif choice == '5':
-            example_5_advanced_job_search()
-        elif choice == '6':
-            example_6_tsc_autocomplete_details()
-        elif choice == '7':
-            example_7_ccs_autocomplete_details()
+            run_all_examples(api)
+        elif choice.isdigit() and int(choice) in EXAMPLES:
+            EXAMPLES[int(choice)](api)
         else:
             print("Invalid choice. Please try again.")
 
 
+def main():
+    """
+    Command-line entry point.
+    
+    Usage:
+    python src/skills_framework_api_examples.py [--no-cache] all
+    python src/skills_framework_api_examples.py [--no-cache] run --example N
+    python src/skills_framework_api_examples.py [--no-cache] [interactive]
+    """
+    parser = argparse.ArgumentParser(description="Skills Framework API examples")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always query the API instead of the on-disk response cache")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.add_parser("all", help="run all examples concurrently")
+    run_parser = subparsers.add_parser("run", help="run a single example")
+    run_parser.add_argument("--example", type=int, choices=sorted(EXAMPLES), required=True,
+                            help="example number")
+    subparsers.add_parser("interactive", help="pick examples from a menu (default)")
+    args = parser.parse_args()
+    
+    try:
+        api = SkillsFrameworkAPI(use_cache=not args.no_cache)
+    except FileNotFoundError as e:
+        print(f"\n✗ Failed to initialize API client: {e}")
+        return
+    
+    # One client (and session) for whatever runs, closed on the way out
+    with api:
+        if args.command == "all":
+            run_all_examples(api)
+        elif args.command == "run":
+            EXAMPLES[args.example](api)
+        else:
+            interactive_menu(api)
+
+
 if __name__ == "__main__":
     main()
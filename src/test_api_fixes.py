@@ -4,54 +4,87 @@ Certificate Authentication Endpoints Verification
 This script verifies all certificate-authenticated endpoints are working correctly.
 Runs quick tests on all 6 working endpoints to ensure connectivity and proper responses.
 
-Usage: python src/test_api_fixes.py
+Usage: python src/test_api_fixes.py [--no-cache]
+
+Set WSG_CACHE=1 to answer repeated runs from an on-disk response cache
+(requires requests-cache); --no-cache forces live requests regardless.
 """
 
-from skills_framework_api_examples import SkillsFrameworkAPI
+from skills_framework_api_examples import AsyncSkillsFrameworkAPI, SkillsFrameworkAPI, run_in_parallel
+import argparse
+import asyncio
+import functools
 import json
+import os
 
 
-def test_endpoint(name, func, *args, **kwargs):
-    """Test a single endpoint and display results."""
-    print(f"\n{'='*70}")
-    print(f"Testing: {name}")
-    print(f"{'='*70}")
-    
+def test_endpoint(name, func, *args, out=None, **kwargs):
+    """Test a single endpoint and display results on out (default: stdout)."""
     try:
         result = func(*args, **kwargs)
+    except Exception as e:
+        result = e
+    return report_result(name, result, out)
+
+
+def report_result(name, result, out=None):
+    """Display one endpoint's result (or the exception it raised); return whether it passed."""
+    print(f"\n{'='*70}", file=out)
+    print(f"Testing: {name}", file=out)
+    print(f"{'='*70}", file=out)
+    
+    try:
+        if isinstance(result, Exception):
+            raise result
         
         if result and result.get('status') in [200, '200']:
-            print(f"✓ SUCCESS - Status: {result.get('status')}")
+            print(f"✓ SUCCESS - Status: {result.get('status')}", file=out)
             
             # Display data summary
             if 'data' in result:
                 data = result['data']
                 if isinstance(data, dict):
                     if 'jobRoles' in data:
-                        print(f"  - Job Roles Count: {len(data['jobRoles'])}")
+                        print(f"  - Job Roles Count: {len(data['jobRoles'])}", file=out)
                     elif 'codes' in data:
-                        print(f"  - Codes Count: {len(data['codes'])}")
+                        print(f"  - Codes Count: {len(data['codes'])}", file=out)
                     elif 'technicalSkillCompetencies' in data:
-                        print(f"  - TSC Details Count: {len(data['technicalSkillCompetencies'])}")
+                        print(f"  - TSC Details Count: {len(data['technicalSkillCompetencies'])}", file=out)
                     elif 'genericSkillCompetencies' in data:
-                        print(f"  - GSC Details Count: {len(data['genericSkillCompetencies'])}")
+                        print(f"  - GSC Details Count: {len(data['genericSkillCompetencies'])}", file=out)
                     else:
-                        print(f"  - Data Keys: {list(data.keys())}")
+                        print(f"  - Data Keys: {list(data.keys())}", file=out)
                 elif isinstance(data, list):
-                    print(f"  - Items Count: {len(data)}")
+                    print(f"  - Items Count: {len(data)}", file=out)
             
             return True
         else:
             status = result.get('status') if result else 'No response'
-            print(f"✗ FAILED - Status: {status}")
+            print(f"✗ FAILED - Status: {status}", file=out)
             return False
             
     except Exception as e:
-        print(f"✗ ERROR: {str(e)}")
+        print(f"✗ ERROR: {str(e)}", file=out)
         return False
 
 
+async def fetch_all_async(api, tests):
+    """Call every endpoint concurrently on the async client; failures are returned, not raised."""
+    async with api:
+        return await asyncio.gather(
+            *(getattr(api, method)(**kwargs) for _, _, method, kwargs in tests),
+            return_exceptions=True
+        )
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Verify the certificate-authenticated endpoints")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always query the API, even if WSG_CACHE=1")
+    args = parser.parse_args()
+    # A verification run should see the live API, so caching is opt-in here
+    use_cache = os.environ.get("WSG_CACHE") == "1" and not args.no_cache
+    
     print("\n" + "="*70)
     print("CERTIFICATE AUTHENTICATION ENDPOINTS VERIFICATION")
     print("="*70)
@@ -59,7 +92,15 @@ def main():
     print("Base URL: https://api.ssg-wsg.sg/skillsFramework")
     
     try:
-        api = SkillsFrameworkAPI()
+        if use_cache:
+            api = SkillsFrameworkAPI(use_cache=True)
+        else:
+            try:
+                # Live checks go out together on one async (HTTP/2 when
+                # available) connection; without httpx, fall back to threads
+                api = AsyncSkillsFrameworkAPI()
+            except ImportError:
+                api = SkillsFrameworkAPI(use_cache=False)
         print("\n✓ API Client initialized successfully")
         print(f"  Base URL: {api.BASE_URL}")
         print(f"  Certificate: {api.cert_path}")
@@ -67,64 +108,48 @@ def main():
         print(f"\n✗ Failed to initialize API client: {e}")
         return
     
-    # Test results tracking
-    results = {}
-    
-    # Test 1: Job Roles Search
-    results['Job Roles Search'] = test_endpoint(
-        "Job Roles Search - /jobRoles",
-        api.get_job_roles,
-        keyword="data",
-        page=0,
-        page_size=5
-    )
-    
-    # Test 2: Job Role Titles Autocomplete
-    results['Job Role Titles'] = test_endpoint(
-        "Job Role Titles Autocomplete - /jobRoles/titles",
-        api.get_job_role_titles,
-        keyword="data"
-    )
-    
-    # Test 3: TSC Technical Skills (Basic)
-    results['TSC Basic'] = test_endpoint(
-        "TSC Basic - /codes/skillsAndCompetencies/technical/autocomplete",
-        api.get_tsc_technical_skills,
-        keyword="data"
-    )
-    
-    # Test 4: CCS Generic Skills (Basic)
-    results['CCS Basic'] = test_endpoint(
-        "CCS Basic - /codes/skillsAndCompetencies/generic/autocomplete",
-        api.get_ccs_generic_skills,
-        keyword="communication"
-    )
+    # (key, display name, endpoint method name, keyword arguments)
+    tests = [
+        ('Job Roles Search', "Job Roles Search - /jobRoles",
+         'get_job_roles', dict(keyword="data", page=0, page_size=5)),
+        ('Job Role Titles', "Job Role Titles Autocomplete - /jobRoles/titles",
+         'get_job_role_titles', dict(keyword="data")),
+        ('TSC Basic', "TSC Basic - /codes/skillsAndCompetencies/technical/autocomplete",
+         'get_tsc_technical_skills', dict(keyword="data")),
+        ('CCS Basic', "CCS Basic - /codes/skillsAndCompetencies/generic/autocomplete",
+         'get_ccs_generic_skills', dict(keyword="communication")),
+        ('TSC Details', "TSC Details - /codes/skillsAndCompetencies/technical/autocomplete/details",
+         'get_tsc_autocomplete_details', dict(keyword="data")),
+        ('CCS Details', "CCS Details - /codes/skillsAndCompetencies/generic/autocomplete/details",
+         'get_ccs_autocomplete_details', dict(keyword="comm")),
+    ]
     
-    # Test 5: TSC Autocomplete Details
-    results['TSC Details'] = test_endpoint(
-        "TSC Details - /codes/skillsAndCompetencies/technical/autocomplete/details",
-        api.get_tsc_autocomplete_details,
-        keyword="data"
-    )
-    
-    # Test 6: CCS Autocomplete Details
-    results['CCS Details'] = test_endpoint(
-        "CCS Details - /codes/skillsAndCompetencies/generic/autocomplete/details",
-        api.get_ccs_autocomplete_details,
-        keyword="comm"
-    )
+    if isinstance(api, AsyncSkillsFrameworkAPI):
+        # Fetch everything at once, then report in test order
+        fetched = asyncio.run(fetch_all_async(api, tests))
+        outcomes = [report_result(name, result) for (_, name, _, _), result in zip(tests, fetched)]
+    else:
+        # Run all tests concurrently over the client's shared session
+        with api:
+            outcomes = run_in_parallel([
+                functools.partial(test_endpoint, name, getattr(api, method), **kwargs)
+                for _, name, method, kwargs in tests
+            ])
+    results = {key: success for (key, _, _, _), success in zip(tests, outcomes)}
     
     # Summary
     print("\n" + "="*70)
     print("TEST SUMMARY")
     print("="*70)
     
-    passed = sum(1 for v in results.values() if v)
-    total = len(results)
-    
+    # Count and format the results in one pass
+    passed = 0
+    lines = []
     for name, success in results.items():
-        status = "✓ PASS" if success else "✗ FAIL"
-        print(f"{status} - {name}")
+        passed += success
+        lines.append(f"{'✓ PASS' if success else '✗ FAIL'} - {name}")
+    total = len(results)
+    print("\n".join(lines))
     
     print(f"\nResults: {passed}/{total} tests passed ({passed/total*100:.0f}%)")
     
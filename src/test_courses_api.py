@@ -1,177 +1,405 @@
 """
 Quick test script to verify Courses API endpoints with certificate authentication.
 This script tests basic connectivity and identifies which endpoints work.
+
+Usage: python src/test_courses_api.py [--no-cache]
+
+Set WSG_CACHE=1 to answer repeated runs from an on-disk response cache
+(requires requests-cache); --no-cache forces live requests regardless.
+Set WSG_TIMEOUT (seconds, e.g. "5,10" for connect,read or "15") to change
+the request timeout.
 """
 
 import requests
-import json
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+import argparse
+import functools
+import io
 import os
-from typing import Dict, Any
+import ssl
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, Union
+from urllib.parse import quote, urlencode
+
+from api_common import KeepAliveHTTPAdapter, client_ssl_context
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # Optional: without it every run hits the API
+    requests_cache = None
 
 # Configuration
 BASE_URL = "https://api.ssg-wsg.sg"
-CERT_PATH = os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem")
-KEY_PATH = os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem")
+CERT_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "certificates", "cert.pem"))
+KEY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "certificates", "key.pem"))
+
+# On-disk response cache used when WSG_CACHE=1
+HTTP_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "test_courses_api_cache")
+
+# (connect, read) timeout in seconds, so a hung endpoint fails fast
+DEFAULT_TIMEOUT = (5.0, 10.0)
+
+def parse_timeout(value: str) -> Union[float, Tuple[float, float]]:
+    """
+    Parse WSG_TIMEOUT: one number, or "connect,read".
+    
+    Anything else (non-numeric, non-positive, or more than two values) is
+    reported and DEFAULT_TIMEOUT is used instead.
+    """
+    try:
+        parts = tuple(float(t) for t in value.split(","))
+    except ValueError:
+        parts = ()
+    if not 1 <= len(parts) <= 2 or not all(0 < t < float("inf") for t in parts):
+        print(f"Ignoring invalid WSG_TIMEOUT={value!r} (expected e.g. \"15\" or \"5,10\"); "
+              f"using {DEFAULT_TIMEOUT}", file=sys.stderr)
+        return DEFAULT_TIMEOUT
+    return parts[0] if len(parts) == 1 else parts
+
+TIMEOUT = parse_timeout(os.environ.get("WSG_TIMEOUT", "5,10"))
+
+# Used by the course-specific tests when the keyword search finds no course
+FALLBACK_COURSE_REF = "SCN-198202248E-01-CRS-N-0027685"
+
+# Headers sent with every test unless the test overrides them
+DEFAULT_HEADERS = MappingProxyType({'x-api-version': 'v1'})
+
+# The endpoint tests, in report order. A test with "input_from" runs after the
+# named test and fills {course_ref} in its endpoint from that test's response.
+TESTS = (
+    {
+        'name': 'Course Categories',
+        'endpoint': "/courses/categories",
+        'params': {'keyword': 'Training'},
+        'description': "1. Course Categories - Retrieve browse categories by keyword",
+    },
+    {
+        'name': 'Course Tags',
+        'endpoint': "/courses/tags",
+        'params': {'sortBy': '0'},  # 0=text, 1=count
+        'description': "2. Course Tags - Retrieve course tags",
+    },
+    {
+        'name': 'Course SubCategories',
+        'endpoint': "/courses/subcategories",
+        'params': {'categoryId': '34'},  # Using a category ID
+        'description': "3. Course SubCategories - Retrieve subcategories by category ID",
+    },
+    {
+        'name': 'Retrieve Courses (Keyword)',
+        'endpoint': "/courses/directory",
+        'params': {
+            'pageSize': '10',
+            'page': '0',
+            'keyword': 'python'
+        },
+        'headers': {'x-api-version': 'v2.1'},
+        'description': "4. Retrieve Courses - Search by keyword",
+    },
+    {
+        'name': 'Retrieve Courses (Tagging)',
+        'endpoint': "/courses/directory",
+        'params': {
+            'pageSize': '10',
+            'page': '0',
+            'taggingCodes': '1',  # SFC
+            'courseSupportEndDate': '20250101',
+            'retrieveType': 'FULL'
+        },
+        'headers': {'x-api-version': 'v2.1'},
+        'description': "5. Retrieve Courses - Search by tagging code",
+    },
+    {
+        'name': 'Course Autocomplete',
+        'endpoint': "/courses/autocomplete",
+        'params': {'keyword': 'data'},
+        'description': "6. Course Autocomplete - Get course title suggestions",
+    },
+    {
+        'name': 'Popular Courses',
+        'endpoint': "/courses/popular",
+        'params': {'taggingCodes': '1'},  # SFC
+        'description': "7. Popular Courses - Get popular courses by tagging",
+    },
+    {
+        'name': 'Featured Courses',
+        'endpoint': "/courses/featured",
+        'params': {
+            'pageSize': '10',
+            'page': '0'
+        },
+        'description': "8. Featured Courses - Get featured courses",
+    },
+    # These need a valid course reference number: use the first course
+    # found by the keyword search
+    {
+        'name': 'Related Courses',
+        'endpoint': "/courses/related/{course_ref}",
+        'input_from': 'Retrieve Courses (Keyword)',
+        'description': "9. Related Courses - Get courses related to a specific course",
+    },
+    {
+        'name': 'Course Details',
+        'endpoint': "/courses/directory/{course_ref}",
+        'params': {'includeExpiredCourses': 'true'},
+        'headers': {'x-api-version': 'v1.2'},
+        'input_from': 'Retrieve Courses (Keyword)',
+        'description': "10. Course Details - Get detailed course information",
+    },
+)
+
+# Tests whose response body other tests read, so they can't be status-only probes
+BODY_NEEDED = frozenset(test['input_from'] for test in TESTS if 'input_from' in test)
+
+def build_url(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Full request URL, with the query string encoded in sorted (stable) order."""
+    query = urlencode(sorted(params.items())) if params else ""
+    return f"{BASE_URL}{endpoint}?{query}" if query else f"{BASE_URL}{endpoint}"
+
+def probe_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Ask paged endpoints for a single result when only the status matters."""
+    if params and 'pageSize' in params:
+        return {**params, 'pageSize': '1'}
+    return params
 
-def test_endpoint(endpoint: str, method: str = "GET", params: Dict[str, Any] = None, 
-                  headers: Dict[str, str] = None, description: str = "") -> bool:
-    """Test a single endpoint and return whether it's working."""
-    url = f"{BASE_URL}{endpoint}"
+def request_params(test: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Query parameters a TESTS entry is sent with."""
+    params = test.get('params')
+    return params if test['name'] in BODY_NEEDED else probe_params(params)
+
+# Request URLs of TESTS, encoded once at import; {course_ref} is filled in later
+TEST_URLS = MappingProxyType({test['name']: build_url(test['endpoint'], request_params(test))
+                              for test in TESTS})
+
+def probe_endpoint(session: requests.Session, url: str,
+                   headers: Dict[str, str]) -> Tuple[requests.Response, bytes]:
+    """
+    Check an endpoint's status without downloading its whole body.
     
-    if headers is None:
-        headers = {}
+    Tries HEAD first; if that doesn't return 200 (many endpoints don't route
+    HEAD), falls back to a streamed GET that reads only the first chunk.
+    A CachedSession only caches GET, so there HEAD is skipped and the
+    (possibly cached) GET is used directly.
+    Returns the response and whatever body bytes were read.
+    """
+    if requests_cache is None or not isinstance(session, requests_cache.CachedSession):
+        response = session.head(url, headers=headers, timeout=TIMEOUT)
+        if response.status_code == 200:
+            return response, b""
     
-    # Always add x-api-version header
-    if 'x-api-version' not in headers:
-        headers['x-api-version'] = 'v1'
+    response = session.get(url, headers=headers, timeout=TIMEOUT, stream=True)
+    with response:
+        body = next(response.iter_content(2048), b"")
+    return response, body
+
+def test_endpoint(session: requests.Session, endpoint: str, method: str = "GET",
+                  params: Dict[str, Any] = None, headers: Dict[str, str] = None,
+                  description: str = "", probe_only: bool = True,
+                  url: Optional[str] = None) -> Tuple[Optional[requests.Response], str]:
+    """
+    Test a single endpoint over the shared session.
+    
+    With probe_only (the default), a GET is checked via probe_endpoint and
+    paged endpoints are asked for a single result, since only the status
+    matters; pass probe_only=False when the response body is needed.
+    url, if given, is the prebuilt request URL (see TEST_URLS), and params
+    are then only shown in the report.
+    
+    Returns the response if the endpoint is working (status 200), else None,
+    so dependent tests can read values out of it, together with the test's
+    report text. The report is buffered rather than printed so concurrent
+    tests don't contend for stdout.
+    """
+    headers = {**DEFAULT_HEADERS, **(headers or {})}
+    probe = probe_only and method == "GET"
+    if url is None:
+        if probe:
+            params = probe_params(params)
+        url = build_url(endpoint, params)
+    buf = io.StringIO()
     
     try:
-        print(f"\n{'='*80}")
-        print(f"Testing: {description}")
-        print(f"Endpoint: {method} {endpoint}")
-        print(f"Params: {params}")
-        print(f"Headers: {headers}")
+        print(f"\n{'='*80}", file=buf)
+        print(f"Testing: {description}", file=buf)
+        print(f"Endpoint: {method} {endpoint}", file=buf)
+        print(f"Params: {params}", file=buf)
+        print(f"Headers: {headers}", file=buf)
         
-        response = requests.request(
-            method=method,
-            url=url,
-            cert=(CERT_PATH, KEY_PATH),
-            params=params,
-            headers=headers,
-            timeout=30
-        )
+        if probe:
+            response, body = probe_endpoint(session, url, headers)
+        else:
+            response = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                timeout=TIMEOUT
+            )
+            body = response.content
+        text = body[:2048].decode(response.encoding or 'utf-8', errors='replace')
         
-        print(f"Status Code: {response.status_code}")
+        cached = " (cached)" if getattr(response, 'from_cache', False) else ""
+        print(f"Status Code: {response.status_code}{cached}", file=buf)
         
         if response.status_code == 200:
-            print("✓ SUCCESS")
-            data = response.json()
-            # Print a sample of the response
-            print(f"Response preview: {json.dumps(data, indent=2)[:500]}...")
-            return True
+            print("✓ SUCCESS", file=buf)
+            # The preview is only for someone watching a terminal; redirected
+            # runs (e.g. CI logs) just record the body size
+            if sys.stdout.isatty():
+                # Print a sample of the raw body; no need to parse the whole
+                # payload just to show its first 500 characters
+                print(f"Response preview: {text[:500] or '(status only)'}...", file=buf)
+            elif not probe:
+                print(f"Response bytes: {len(body)}", file=buf)
+            elif 'Content-Length' in response.headers:
+                print(f"Response bytes: {response.headers['Content-Length']} (not downloaded)", file=buf)
+            return response, buf.getvalue()
         else:
-            print(f"✗ FAILED - Status: {response.status_code}")
-            print(f"Response: {response.text[:500]}")
-            return False
+            print(f"✗ FAILED - Status: {response.status_code}", file=buf)
+            print(f"Response: {text[:500]}", file=buf)
+            return None, buf.getvalue()
             
     except Exception as e:
-        print(f"✗ ERROR: {str(e)}")
-        return False
+        print(f"✗ ERROR: {str(e)}", file=buf)
+        return None, buf.getvalue()
+
+def course_ref_from(response: Optional[requests.Response]) -> str:
+    """First course reference number in a /courses/directory search response."""
+    try:
+        data = orjson.loads(response.content) if orjson is not None else response.json()
+        return data['data']['courses'][0]['referenceNumber']
+    except (AttributeError, ValueError, LookupError, TypeError):
+        return FALLBACK_COURSE_REF
 
 def main():
     """Test all Courses API endpoints."""
+    parser = argparse.ArgumentParser(description="Test the Courses API endpoints")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always query the API, even if WSG_CACHE=1")
+    args = parser.parse_args()
+    use_cache = (os.environ.get("WSG_CACHE") == "1" and not args.no_cache
+                 and requests_cache is not None)
+    
     print("="*80)
     print("COURSES API - CERTIFICATE AUTHENTICATION TEST")
     print("="*80)
     
-    results = {}
-    
-    # Test 1: Course Categories
-    results['Course Categories'] = test_endpoint(
-        endpoint="/courses/categories",
-        params={'keyword': 'Training'},
-        description="1. Course Categories - Retrieve browse categories by keyword"
-    )
-    
-    # Test 2: Course Tags
-    results['Course Tags'] = test_endpoint(
-        endpoint="/courses/tags",
-        params={'sortBy': '0'},  # 0=text, 1=count
-        description="2. Course Tags - Retrieve course tags"
-    )
-    
-    # Test 3: Course SubCategories
-    results['Course SubCategories'] = test_endpoint(
-        endpoint="/courses/subcategories",
-        params={'categoryId': '34'},  # Using a category ID
-        description="3. Course SubCategories - Retrieve subcategories by category ID"
-    )
-    
-    # Test 4: Retrieve Courses by Keyword
-    results['Retrieve Courses (Keyword)'] = test_endpoint(
-        endpoint="/courses/directory",
-        params={
-            'pageSize': '10',
-            'page': '0',
-            'keyword': 'python'
-        },
-        headers={'x-api-version': 'v2.1'},
-        description="4. Retrieve Courses - Search by keyword"
-    )
-    
-    # Test 5: Retrieve Courses by Tagging Code
-    results['Retrieve Courses (Tagging)'] = test_endpoint(
-        endpoint="/courses/directory",
-        params={
-            'pageSize': '10',
-            'page': '0',
-            'taggingCodes': '1',  # SFC
-            'courseSupportEndDate': '20250101',
-            'retrieveType': 'FULL'
-        },
-        headers={'x-api-version': 'v2.1'},
-        description="5. Retrieve Courses - Search by tagging code"
-    )
-    
-    # Test 6: Course Autocomplete
-    results['Course Autocomplete'] = test_endpoint(
-        endpoint="/courses/autocomplete",
-        params={'keyword': 'data'},
-        description="6. Course Autocomplete - Get course title suggestions"
-    )
-    
-    # Test 7: Popular Courses
-    results['Popular Courses'] = test_endpoint(
-        endpoint="/courses/popular",
-        params={'taggingCodes': '1'},  # SFC
-        description="7. Popular Courses - Get popular courses by tagging"
-    )
-    
-    # Test 8: Featured Courses
-    results['Featured Courses'] = test_endpoint(
-        endpoint="/courses/featured",
-        params={
-            'pageSize': '10',
-            'page': '0'
-        },
-        description="8. Featured Courses - Get featured courses"
-    )
-    
-    # Test 9: Related Courses (Note: requires valid course reference number)
-    # This one might fail if we don't have a valid course reference
-    results['Related Courses'] = test_endpoint(
-        endpoint="/courses/related/SCN-198202248E-01-CRS-N-0027685",
-        description="9. Related Courses - Get courses related to a specific course"
-    )
-    
-    # Test 10: Course Details (Note: requires valid course reference number)
-    results['Course Details'] = test_endpoint(
-        endpoint="/courses/directory/SCN-198202248E-01-CRS-N-0027685",
-        params={'includeExpiredCourses': 'true'},
-        headers={'x-api-version': 'v1.2'},
-        description="10. Course Details - Get detailed course information"
-    )
-    
-    # Print summary
-    print("\n" + "="*80)
-    print("TEST SUMMARY")
-    print("="*80)
+    # The client certificate is loaded into one SSLContext, shared by every
+    # pooled connection instead of re-reading the PEM files per connection
+    try:
+        ssl_context = client_ssl_context(CERT_PATH, KEY_PATH)
+    except (OSError, ssl.SSLError) as e:
+        print(f"\n✗ Failed to load client certificate: {e}")
+        return
     
-    working_count = sum(1 for result in results.values() if result)
-    total_count = len(results)
+    # One session for all tests, so the TLS handshake with the client
+    # certificate is done once and the connection is kept alive
+    if use_cache:
+        # Keyed on method, URL, params and all request headers
+        session = requests_cache.CachedSession(
+            HTTP_CACHE_PATH,
+            backend='sqlite',
+            expire_after=600,
+            allowable_methods=('GET',),
+            match_headers=True
+        )
+    else:
+        session = requests.Session()
+    
+    with session:
+        # Ask for compressed responses, advertising only the codings urllib3
+        # can decode here (br only when brotli is installed)
+        session.headers['Accept-Encoding'] = make_headers(accept_encoding=True)['accept-encoding']
+        # Retry transient errors with backoff instead of reporting them as
+        # failures; the final response is still returned for reporting
+        session.mount(BASE_URL, KeepAliveHTTPAdapter(
+            ssl_context=ssl_context,
+            pool_connections=1,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']),
+                raise_on_status=False
+            )
+        ))
+        results = run_tests(session)
     
-    print(f"\nTotal Endpoints Tested: {total_count}")
-    print(f"Working: {working_count}")
-    print(f"Failed: {total_count - working_count}")
-    print(f"Success Rate: {working_count/total_count*100:.1f}%\n")
+    print_summary(results)
+
+
+def run_tests(session: requests.Session) -> Dict[str, bool]:
+    """
+    Run TESTS concurrently and return each one's outcome by name.
+    
+    Tests run in two layers: the independent ones first, all at once, then
+    the ones that take a course reference number from an earlier result.
+    """
+    responses: Dict[str, Optional[requests.Response]] = {}
+    
+    def call(test: Dict[str, Any]):
+        endpoint, url = test['endpoint'], TEST_URLS[test['name']]
+        if 'input_from' in test:
+            course_ref = quote(course_ref_from(responses[test['input_from']]), safe='')
+            endpoint = endpoint.format(course_ref=course_ref)
+            url = url.format(course_ref=course_ref)
+        return functools.partial(
+            test_endpoint, session, endpoint,
+            params=request_params(test),
+            headers=test.get('headers'),
+            description=test['description'],
+            probe_only=test['name'] not in BODY_NEEDED,
+            url=url
+        )
+    
+    # All tests share the session's connection pool; each test's report is
+    # written as one block, in table order
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        for layer in ([t for t in TESTS if 'input_from' not in t],
+                      [t for t in TESTS if 'input_from' in t]):
+            outcomes = executor.map(lambda f: f(), [call(t) for t in layer])
+            for test, (response, log) in zip(layer, outcomes):
+                responses[test['name']] = response
+                sys.stdout.write(log)
     
-    print("Detailed Results:")
-    print("-" * 80)
+    return {test['name']: responses[test['name']] is not None for test in TESTS}
+
+def print_summary(results: Dict[str, bool]) -> None:
+    """Print the pass/fail summary of the endpoint tests."""
+    # Count and format the rows in one pass over the results
+    working_count = 0
+    rows = []
     for name, result in results.items():
-        status = "✓ WORKING" if result else "✗ FAILED"
-        print(f"{name:.<50} {status}")
+        working_count += result
+        rows.append(f"{name:.<50} {'✓ WORKING' if result else '✗ FAILED'}")
+    total_count = len(results)
     
-    print("\n" + "="*80)
+    sys.stdout.write("\n".join([
+        "",
+        "="*80,
+        "TEST SUMMARY",
+        "="*80,
+        "",
+        f"Total Endpoints Tested: {total_count}",
+        f"Working: {working_count}",
+        f"Failed: {total_count - working_count}",
+        f"Success Rate: {working_count/total_count*100:.1f}%",
+        "",
+        "Detailed Results:",
+        "-" * 80,
+        *rows,
+        "",
+        "="*80,
+        "",
+    ]))
 
 if __name__ == "__main__":
     main()